@@ -67,12 +67,12 @@ def define_aoi(screen_width, screen_height, aoi_definitions):
         if shape == 'rectangle':
         
             x1, y1, x2, y2 = map(int, coordinates) #Convert to integers
-            mask[y1:y2, x1:x2] = 1  #All pixels within the rectangle are 1
             if x1 < 0 or y1 < 0 or x2 > screen_width or y2 > screen_height:
                 raise ValueError(f"Coordinates exceed screen boundaries.")
+            mask[y1:y2, x1:x2] = 1  #All pixels within the rectangle are 1
         elif shape == 'circle':
             x_center, y_center, radius = map(int, coordinates) #Convert to integers
-            if center_x - radius < 0 or center_y - radius < 0 or center_x + radius > screen_width or center_y + radius > screen_height:
+            if x_center - radius < 0 or y_center - radius < 0 or x_center + radius > screen_width or y_center + radius > screen_height:
                 raise ValueError(f"Circle exceeds screen boundaries.")
             for y in range(screen_height):
                 for x in range(screen_width):
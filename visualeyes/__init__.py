@@ -0,0 +1 @@
+from visualeyes.core import plot_as_scatter, plot_heatmap, overlay_aoi
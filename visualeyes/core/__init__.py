@@ -0,0 +1 @@
+from visualeyes.core.plotting import plot_as_scatter, plot_heatmap, overlay_aoi
@@ -0,0 +1,330 @@
+from functools import lru_cache
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.patches import Circle, Rectangle
+from matplotlib.collections import PatchCollection
+
+try:
+    from fast_histogram import histogram2d as _fast_histogram2d
+except ImportError: #fast-histogram is optional; fall back to the bincount kernel below
+    _fast_histogram2d = None
+
+try:
+    #Import the pieces directly: referencing them through the module object
+    #inside the jitted body would defeat cache=True (dynamic globals warning)
+    from numba import njit, prange, get_num_threads
+except ImportError: #numba is optional; only needed for backend='numba'
+    njit = None
+
+try:
+    import cupy
+except ImportError: #cupy is optional; only needed for backend='cupy'
+    cupy = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _hist2d_numba(x, y, bins_x, bins_y, screen_width, screen_height):
+        #Each thread bins its own chunk into a private sub-histogram to avoid
+        #contention, then the sub-histograms are summed
+        nthreads = get_num_threads()
+        partial = np.zeros((nthreads, bins_x, bins_y), dtype=np.int64)
+        n = x.shape[0]
+        chunk = (n + nthreads - 1) // nthreads
+
+        for t in prange(nthreads):
+            start = t * chunk
+            stop = min(start + chunk, n)
+            for i in range(start, stop):
+                ix = int(x[i] * bins_x / screen_width)
+                iy = int(y[i] * bins_y / screen_height)
+                #Fold samples exactly on the upper screen edge into the last
+                #bin, consistent with the other kernels
+                if ix == bins_x and x[i] == screen_width:
+                    ix = bins_x - 1
+                if iy == bins_y and y[i] == screen_height:
+                    iy = bins_y - 1
+                if 0 <= ix < bins_x and 0 <= iy < bins_y:
+                    partial[t, ix, iy] += 1
+
+        out = np.zeros((bins_x, bins_y), dtype=np.int64)
+        for t in range(nthreads):
+            out += partial[t]
+
+        return out
+
+from visualeyes.core.validation import (
+    screen_dimensions_validation,
+    dataframe_validation,
+    aoi_definitions_validation,
+)
+
+@lru_cache(maxsize=32)
+def _validated(screen_dimensions, aoi_key):
+    """
+    Validate hashable keys for screen dimensions and AOI definitions, caching
+    the result so identical inputs (e.g. the same AOIs drawn on every frame of
+    an animation) are only validated once.
+    """
+    screen_dimensions_validation(screen_dimensions)
+    if aoi_key is not None:
+        aoi_definitions_validation([{'shape': shape, 'coordinates': coordinates}
+                                    for shape, coordinates in aoi_key])
+
+def _validate_inputs(screen_dimensions, aoi_definitions=None):
+    """
+    Validate screen dimensions and (optionally) AOI definitions through the
+    cached helper when the inputs can form a cache key, falling back to direct
+    validation otherwise so malformed inputs still raise the usual ValueError.
+    """
+    try:
+        screen_key = tuple(screen_dimensions)
+        aoi_key = None
+        if aoi_definitions is not None:
+            aoi_key = tuple((aoi['shape'], tuple(aoi['coordinates']))
+                            for aoi in aoi_definitions)
+        _validated(screen_key, aoi_key)
+    except (TypeError, KeyError):
+        #Inputs that cannot form or hash a cache key (e.g. list elements) get
+        #validated directly so they raise the usual ValueError
+        screen_dimensions_validation(screen_dimensions)
+        if aoi_definitions is not None:
+            aoi_definitions_validation(aoi_definitions)
+
+def plot_as_scatter(data, screen_dimensions, aoi_definitions=None, marker_size=20,
+                    output_path=None, rasterize_threshold=50_000, ax=None):
+    """
+    Plot fixations as a scatter plot, with marker sizes scaled by fixation duration.
+
+    Inputs:
+    - data (pandas DataFrame): Fixation data with 'axp', 'ayp' (average fixation
+      position) and 'stime', 'etime' (fixation start/end time) columns.
+    - screen_dimensions (tuple): Screen dimensions as (screen_height, screen_width) in pixels.
+    - aoi_definitions (list of dict, optional): AOI definitions to overlay on the plot.
+    - marker_size (int): Base marker size for the scatter points.
+    - output_path (str, optional): If given, save the figure to this path.
+    - rasterize_threshold (int): Above this many fixations, draw a binned density
+      image instead of per-point markers to keep rendering and file size bounded.
+    - ax (matplotlib Axes, optional): Axes to draw on. Pass the axes returned by a
+      previous call when plotting in a loop to skip figure and axis setup.
+
+    Output:
+    - fig, ax: The Matplotlib figure and axes.
+    """
+    #Check inputs
+    _validate_inputs(screen_dimensions, aoi_definitions)
+    x_coord, y_coord = dataframe_validation(data, 'axp', 'ayp')
+
+    #Keep fixations that fall inside the screen area
+    in_bounds = ((x_coord >= 0) & (x_coord < screen_dimensions[1])
+                 & (y_coord >= 0) & (y_coord < screen_dimensions[0]))
+    clean_data = data.loc[in_bounds]
+
+    if ax is None:
+        fig, ax = plt.subplots()
+    else:
+        fig = ax.figure
+
+    if len(clean_data) > rasterize_threshold:
+        #Per-point markers dominate render and save time at this scale; show
+        #a binned density image instead (one bin per 4x4 pixel block)
+        bins_x = max(1, screen_dimensions[1] // 4)
+        bins_y = max(1, screen_dimensions[0] // 4)
+        density = _histogram2d_uniform(clean_data['axp'].to_numpy(),
+                                       clean_data['ayp'].to_numpy(),
+                                       bins_x, bins_y,
+                                       screen_dimensions[1], screen_dimensions[0])
+        ax.imshow(density.T, cmap='hot', origin='upper',
+                  extent=[0, screen_dimensions[1], screen_dimensions[0], 0])
+        del density
+    else:
+        #Scale marker sizes by fixation duration, longest fixation gets the largest marker
+        durations = clean_data['etime'].to_numpy() - clean_data['stime'].to_numpy()
+        max_duration = durations.max() if durations.size else 0
+        if max_duration > 0:
+            sizes = (3.0 * marker_size / max_duration) * durations
+        else: #No fixations left on screen, or all zero-length: use the base size
+            sizes = marker_size
+        ax.scatter(clean_data['axp'], clean_data['ayp'], s=sizes, alpha=0.5,
+                   rasterized=True)
+        del durations, sizes
+
+    #Everything is handed off to the artists; drop our references so the
+    #filtered table is not pinned through the (slow) render/save stage
+    del clean_data, in_bounds, x_coord, y_coord
+
+    if aoi_definitions is not None:
+        overlay_aoi(aoi_definitions, screen_dimensions, ax)
+
+    #Only set up the axes once so reused axes are not re-inverted
+    if not getattr(ax, '_visualeyes_scatter_setup', False):
+        ax.set_xlim(0, screen_dimensions[1])
+        ax.set_ylim(0, screen_dimensions[0])
+        ax.invert_yaxis() #Screen coordinates have the origin at the top-left
+        ax._visualeyes_scatter_setup = True
+
+    if output_path is not None:
+        fig.savefig(output_path)
+
+    return fig, ax
+
+def _histogram2d_uniform(x, y, bins_x, bins_y, screen_width, screen_height, backend=None):
+    """
+    2D histogram of gaze coordinates over uniform bins spanning the screen.
+
+    Uses fast-histogram when installed; otherwise computes the bin index of
+    each sample directly (uniform bins make it a scale-and-floor) and counts
+    with a single np.bincount, which skips the searchsorted pass of
+    np.histogram2d. Pass backend='numba' to bin in parallel across cores,
+    which helps on very large sample tables (millions of rows).
+
+    Output:
+    - heatmap (2D numpy array): uint32 counts with shape (bins_x, bins_y).
+    """
+    if backend not in (None, 'numba', 'cupy'):
+        raise ValueError(f"Unknown backend: {backend!r}. Use None, 'numba', or 'cupy'.")
+
+    if backend == 'cupy':
+        if cupy is None:
+            raise ImportError("backend='cupy' requires the cupy package to be installed.")
+        counts = cupy.histogram2d(cupy.asarray(x), cupy.asarray(y),
+                                  range=[[0, screen_width], [0, screen_height]],
+                                  bins=[bins_x, bins_y])[0].get()
+    elif backend == 'numba':
+        if njit is None:
+            raise ImportError("backend='numba' requires the numba package to be installed.")
+        counts = _hist2d_numba(np.ascontiguousarray(x, dtype=np.float64),
+                               np.ascontiguousarray(y, dtype=np.float64),
+                               bins_x, bins_y, screen_width, screen_height)
+    elif (np.issubdtype(x.dtype, np.integer) and np.issubdtype(y.dtype, np.integer)
+          and screen_width % bins_x == 0 and screen_height % bins_y == 0):
+        #Trackers often report integer pixel coordinates; when the bin width is
+        #a whole number of pixels the bin index is a pure integer division
+        ix = np.minimum(x // (screen_width // bins_x), bins_x - 1)
+        iy = np.minimum(y // (screen_height // bins_y), bins_y - 1)
+        #Promote before flattening: narrow input dtypes (e.g. int16) overflow
+        #on ix * bins_y for fine binning
+        counts = np.bincount(ix.astype(np.intp) * bins_y + iy,
+                             minlength=bins_x * bins_y).reshape(bins_x, bins_y)
+    elif _fast_histogram2d is not None:
+        #fast-histogram excludes samples exactly on the upper range edge; nudge
+        #them just inside so every backend folds edge samples into the last bin
+        x = np.minimum(x, np.nextafter(screen_width, 0))
+        y = np.minimum(y, np.nextafter(screen_height, 0))
+        counts = _fast_histogram2d(x, y, range=[[0, screen_width], [0, screen_height]],
+                                   bins=[bins_x, bins_y])
+    else:
+        #Promote to float64 before scaling so narrow integer inputs do not
+        #overflow on x * bins_x
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        ix = np.clip((x * bins_x / screen_width).astype(np.intp), 0, bins_x - 1)
+        iy = np.clip((y * bins_y / screen_height).astype(np.intp), 0, bins_y - 1)
+        counts = np.bincount(ix * bins_y + iy, minlength=bins_x * bins_y).reshape(bins_x, bins_y)
+
+    #Counts fit comfortably in uint32; float64/int64 would carry 2x the bytes
+    #into imshow's colormap lookup for no benefit
+    return counts.astype(np.uint32)
+
+def plot_heatmap(data, screen_dimensions, bins_x=100, bins_y=100, aoi_definitions=None,
+                 output_path=None, backend=None, ax=None):
+    """
+    Plot gaze samples as a 2D heatmap over the screen area.
+
+    Inputs:
+    - data (pandas DataFrame): Gaze samples with 'xpos' and 'ypos' columns.
+    - screen_dimensions (tuple): Screen dimensions as (screen_height, screen_width) in pixels.
+    - bins_x (int): Number of heatmap bins along the screen width.
+    - bins_y (int): Number of heatmap bins along the screen height.
+    - aoi_definitions (list of dict, optional): AOI definitions to overlay on the plot.
+    - output_path (str, optional): If given, save the figure to this path.
+    - backend (str, optional): 'numba' to bin in parallel across cores, or 'cupy'
+      to bin on the GPU (each needs its package installed). The GPU pays off only
+      for very large sample tables (millions of rows); by default the fastest
+      available single-threaded CPU kernel is used.
+    - ax (matplotlib Axes, optional): Axes to draw on. Pass the axes returned by a
+      previous call when plotting in a loop to skip figure and colorbar setup.
+
+    Output:
+    - fig, ax: The Matplotlib figure and axes.
+    """
+    #Check inputs
+    _validate_inputs(screen_dimensions, aoi_definitions)
+    x, y = dataframe_validation(data, 'xpos', 'ypos')
+    screen_height, screen_width = screen_dimensions
+
+    #Drop missing and out-of-screen samples with a single mask over the
+    #coordinate arrays, avoiding full-DataFrame copies
+    valid = (np.isfinite(x) & np.isfinite(y)
+             & (x >= 0) & (x <= screen_width)
+             & (y >= 0) & (y <= screen_height))
+    x = x[valid]
+    y = y[valid]
+
+    #Bin the gaze samples over uniform bins spanning the screen
+    heatmap = _histogram2d_uniform(x, y, bins_x, bins_y, screen_width, screen_height,
+                                   backend=backend)
+
+    if ax is None:
+        fig, ax = plt.subplots()
+    else:
+        fig = ax.figure
+
+    image = getattr(ax, '_visualeyes_heatmap_image', None)
+    if image is None:
+        image = ax.imshow(heatmap.T, cmap='hot', origin='upper',
+                          extent=[0, screen_width, screen_height, 0],
+                          vmin=0, vmax=heatmap.max())
+        fig.colorbar(image, ax=ax, label='Number of samples')
+        ax._visualeyes_heatmap_image = image
+    else:
+        #Reused axes: update the existing artist in place so repeated calls do
+        #not stack images, and rescale so the colorbar tracks the new data
+        image.set_data(heatmap.T)
+        image.set_clim(0, heatmap.max())
+
+    if aoi_definitions is not None:
+        overlay_aoi(aoi_definitions, screen_dimensions, ax)
+
+    if output_path is not None:
+        fig.savefig(output_path)
+
+    return fig, ax
+
+def overlay_aoi(aoi_definitions, screen_dimensions, ax):
+    """
+    Draw AOI outlines on top of an existing plot.
+
+    Inputs:
+    - aoi_definitions (list of dict): Each dict defines one AOI (so we can have multiple) with keys:
+        - 'shape': 'rectangle' or 'circle'.
+        - 'coordinates': Tuple of coordinates:
+            - For rectangluar AOI's: (x1, y1, x2, y2), upper-bounds non-inclusive.
+            - For circlular AOI's: (x_center, y_center, radius).
+    - screen_dimensions (tuple): Screen dimensions as (screen_height, screen_width) in pixels.
+    - ax: The Matplotlib axes to draw on.
+
+    Output:
+    - ax: The same axes with the AOI outlines added.
+    """
+    #Check inputs
+    _validate_inputs(screen_dimensions, aoi_definitions)
+
+    #Build one patch per AOI and add them as a single collection, so the
+    #backend draws all outlines in one pass
+    patches = []
+    for aoi in aoi_definitions:
+        shape = aoi['shape'].lower()
+        coordinates = aoi['coordinates']
+
+        if shape == 'rectangle':
+            x1, y1, x2, y2 = map(float, coordinates)
+            patches.append(Rectangle((x1, y1), x2 - x1, y2 - y1))
+        elif shape == 'circle':
+            x_center, y_center, radius = map(float, coordinates)
+            patches.append(Circle((x_center, y_center), radius))
+
+    ax.add_collection(PatchCollection(patches, facecolors='none',
+                                      edgecolors='red', linewidths=1))
+
+    return ax
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+def screen_dimensions_validation(screen_dimensions):
+    """
+    Validate the screen dimensions.
+
+    Inputs:
+    - screen_dimensions (tuple): Screen dimensions as (screen_height, screen_width) in pixels.
+
+    Output:
+    - None. Raises ValueError if the dimensions are invalid.
+    """
+    if not isinstance(screen_dimensions, (tuple, list)) or len(screen_dimensions) != 2:
+        raise ValueError("Screen dimensions must be a (height, width) pair.")
+
+    screen_height, screen_width = screen_dimensions
+
+    if not isinstance(screen_height, (int, np.integer)) or not isinstance(screen_width, (int, np.integer)):
+        raise ValueError("Screen dimensions must be integers.")
+
+    if screen_height <= 0 or screen_width <= 0:
+        raise ValueError("Screen dimensions must be positive.")
+
+def dataframe_validation(data, x_col, y_col):
+    """
+    Validate the eye-tracking DataFrame and pull out the coordinate columns.
+
+    Inputs:
+    - data (pandas DataFrame): Eye-tracking data.
+    - x_col (str): Name of the column holding x coordinates.
+    - y_col (str): Name of the column holding y coordinates.
+
+    Output:
+    - x_coord, y_coord (1D numpy arrays): The coordinate columns as arrays.
+    """
+    if not isinstance(data, pd.DataFrame):
+        raise ValueError("Data must be a pandas DataFrame.")
+
+    missing = [col for col in (x_col, y_col) if col not in data.columns]
+    if missing:
+        raise ValueError(f"Data is missing required columns: {missing}")
+
+    x_coord = data[x_col].to_numpy()
+    y_coord = data[y_col].to_numpy()
+
+    return x_coord, y_coord
+
+def aoi_definitions_validation(aoi_definitions):
+    """
+    Validate a list of AOI definitions.
+
+    Inputs:
+    - aoi_definitions (list of dict): Each dict defines one AOI with keys:
+        - 'shape': 'rectangle' or 'circle'.
+        - 'coordinates': Tuple of coordinates:
+            - For rectangluar AOI's: (x1, y1, x2, y2), upper-bounds non-inclusive.
+            - For circlular AOI's: (x_center, y_center, radius).
+
+    Output:
+    - None. Raises ValueError if any definition is invalid.
+    """
+    if not isinstance(aoi_definitions, list):
+        raise ValueError("AOI definitions must be a list of dictionaries.")
+
+    for aoi in aoi_definitions:
+        if not isinstance(aoi, dict) or 'shape' not in aoi or 'coordinates' not in aoi:
+            raise ValueError("Each AOI must be a dictionary with 'shape' and 'coordinates' keys.")
+
+        shape = aoi['shape'].lower()
+        coordinates = aoi['coordinates']
+
+        if shape == 'rectangle':
+            if len(coordinates) != 4:
+                raise ValueError("Rectangular AOI's need 4 coordinates: (x1, y1, x2, y2).")
+        elif shape == 'circle':
+            if len(coordinates) != 3:
+                raise ValueError("Circular AOI's need 3 coordinates: (x_center, y_center, radius).")
+        else:
+            raise ValueError(f"Unsupported AOI shape: {shape}")